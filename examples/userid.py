@@ -95,7 +95,7 @@ def main():
     # You can use the userid API on a firewall with the Panorama 'target'
     # parameter by creating a Panorama object first, then create a
     # Firewall object with the 'panorama' and 'serial' variables populated.
-    if issubclass(type(device), Panorama):
+    if isinstance(device, Panorama):
         logging.error("Connected to a Panorama, but user-id API is not possible on Panorama.  Exiting.")
         sys.exit(1)
 
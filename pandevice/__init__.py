@@ -73,11 +73,15 @@ def enum(*sequential, **named):
     enums['reverse_mapping'] = reverse
     return type('Enum', (), enums)
 
+# Python 2 has basestring, Python 3 has str and bytes
+try:
+    string_types = basestring
+except NameError:
+    string_types = (str, bytes)
+
+
 def isstring(arg):
-    try:
-        return isinstance(arg, basestring)
-    except NameError:
-        return isinstance(arg, str) or isinstance(arg, bytes)
+    return isinstance(arg, string_types)
 
 
 # Create more debug logging levels
@@ -211,6 +215,81 @@ def tree_legend():
     return graphviz.Source(tree_legend_dot())
 
 
+def run_concurrently(devices, method, args=None, kwargs=None, threads=10):
+    """Invoke the same method on many devices at the same time
+
+    Every API call made by a device blocks until the device answers, so
+    managing many firewalls one after the other takes one round-trip per
+    device.  This runs the calls in a pool of threads instead, so the total
+    time is closer to that of the slowest device.
+
+    Each xapi keeps the last response on itself, so no two devices passed in
+    may share one.  A device may only appear once in `devices`, both members
+    of an HA pair may not be passed together (calls on a passive or failed
+    peer are routed through the other peer's xapi), and neither may two
+    devices under the same Panorama, or a Panorama and a device under it
+    (methods like create() and delete() on such a device are sent through
+    the Panorama's xapi).
+
+    Args:
+        devices (list): The PanDevice instances to call the method on
+        method (str): Name of the method to invoke (eg. "refresh_system_info")
+        args (tuple): Positional arguments to pass to the method
+        kwargs (dict): Keyword arguments to pass to the method
+        threads (int): Maximum number of concurrent API calls
+
+    Returns:
+        list: The return value of the method for each device, in the same
+            order as `devices`.  If any of the calls raised an exception, the
+            exception is re-raised after the remaining calls finish.
+
+    Raises:
+        ValueError: If two of the devices share an xapi.
+
+    Example:
+        results = pandevice.run_concurrently(firewalls, "refresh_system_info")
+
+    """
+    from multiprocessing.pool import ThreadPool
+
+    devices = list(devices)
+    if not devices:
+        return []
+    seen = set()
+    for dev in devices:
+        owners = set(id(x) for x in _xapi_owners(dev))
+        if owners & seen:
+            raise ValueError(
+                'Devices sharing an xapi cannot be run concurrently: {0}'.format(dev))
+        seen |= owners
+    args = tuple(args or ())
+    kwargs = kwargs or {}
+
+    pool = ThreadPool(min(threads, len(devices)))
+    try:
+        return pool.map(
+            lambda dev: getattr(dev, method)(*args, **kwargs), devices)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _xapi_owners(dev):
+    """Return the devices whose xapi a device's API calls may be sent through"""
+    import pandevice.errors as err
+
+    owners = [dev]
+    peer = getattr(dev, 'ha_peer', None)
+    if peer is not None:
+        owners.append(peer)
+    if getattr(dev, 'parent', None) is not None:
+        try:
+            owners.append(dev.panorama())
+        except err.PanDeviceNotSet:
+            pass
+    return owners
+
+
 # Convenience methods used internally by module
 # Do not use these methods outside the module
 
@@ -45,6 +45,11 @@ Root = pandevice.enum("DEVICE", "VSYS", "MGTCONFIG")
 SELF = "/%s"
 ENTRY = "/entry[@name='%s']"
 MEMBER = "/member[text()='%s']"
+DEVICE_XPATH = "/config/devices/entry[@name='localhost.localdomain']"
+
+# Matches the last segment of an xpath, including a final segment with a
+# quoted name that contains slashes (eg. "/entry[@name='ethernet1/1']").
+XPATH_LAST_SEGMENT = re.compile(r"/(?=[^/']*'[^']*'[^/']*$|[^/]*$).*$")
 
 
 # PanObject type
@@ -353,7 +358,7 @@ class PanObject(object):
 
         """
         xpath = self.xpath(root)
-        xpath = re.sub(r"/(?=[^/']*'[^']*'[^/']*$|[^/]*$).*$", "", xpath)
+        xpath = XPATH_LAST_SEGMENT.sub("", xpath, 1)
         return xpath
 
     def xpath_root(self, root_type, vsys, label='vsys'):
@@ -370,12 +375,9 @@ class PanObject(object):
 
     def _root_xpath_vsys(self, vsys, label='vsys'):
         if vsys == 'shared':
-            xpath = '/config/shared'
-        else:
-            xpath = "/config/devices/entry[@name='localhost.localdomain']"
-            xpath += "/{0}/entry[@name='{1}']".format(label, vsys or 'vsys1')
-
-        return xpath
+            return '/config/shared'
+        return (DEVICE_XPATH + '/' + label +
+                "/entry[@name='" + str(vsys or 'vsys1') + "']")
 
     def element(self, with_children=True, comparable=False):
         """Construct an ElementTree for this PanObject and all its children
@@ -1720,13 +1722,12 @@ class PanObject(object):
                     if getattr(node, 'mode', None) in ('ha', 'aggregate-group'):
                         continue
                     vsys = 'vsys1'
-                vsys_dict.setdefault(vsys, {})
-                vsys_dict[vsys].setdefault(node.xpath_import_base(), [])
-                vsys_dict[vsys][node.xpath_import_base()].append(node)
+                vsys_dict.setdefault(vsys, {}).setdefault(
+                    node.xpath_import_base(), []).append(node)
 
         return dev, instances, vsys_dict
 
-    def create_similar(self):
+    def create_similar(self, chunk_size=None):
         """Bulk create all objects similar to this one.
 
         **Modifies the live device**
@@ -1741,7 +1742,14 @@ class PanObject(object):
         included in the resulting XML document, regardless of which vsys
         those subinterfaces existed in.
 
+        Args:
+            chunk_size (int): Maximum number of objects to send per API
+                call.  By default all objects are sent in a single call,
+                but very large sets may need to be split up to stay under
+                the device's request size limit.
+
         """
+        self._check_chunk_size(chunk_size)
         dev, instances, vsys_dict = self._gather_bulk_info('create_similar')
         if not instances:
             return
@@ -1752,14 +1760,15 @@ class PanObject(object):
         new_root = xpath_tokens.pop()
         xpath = '/'.join(xpath_tokens)
 
-        # Append all similar children.
-        shared_root = ET.Element(new_root)
-        for x in instances:
-            shared_root.append(x.element())
+        # Append all similar children, one API call per chunk.
+        for chunk in self._chunks(instances, chunk_size):
+            shared_root = ET.Element(new_root)
+            for x in chunk:
+                shared_root.append(x.element())
 
-        # Perform the create.
-        dev.xapi.set(xpath, ET.tostring(shared_root, encoding='utf-8'),
-                     retry_on_peer=self.HA_SYNC)
+            # Perform the create.
+            dev.xapi.set(xpath, ET.tostring(shared_root, encoding='utf-8'),
+                         retry_on_peer=self.HA_SYNC)
 
         # Do all necessary imports, per vsys, per import xpath.
         self._perform_vsys_dict_import_set(dev, vsys_dict)
@@ -1805,7 +1814,7 @@ class PanObject(object):
         # Do all necessary imports, per vsys, per import xpath.
         self._perform_vsys_dict_import_set(dev, vsys_dict)
 
-    def delete_similar(self):
+    def delete_similar(self, chunk_size=None):
         """Bulk delete all objects similar to this one.
 
         **Modifies the live device**
@@ -1819,7 +1828,12 @@ class PanObject(object):
         ethernet1/5.42, all of the subinterfaces in your pandevice object
         tree for ethernet1/5 would be removed.
 
+        Args:
+            chunk_size (int): Maximum number of objects to delete per API
+                call.  By default all objects are deleted in a single call.
+
         """
+        self._check_chunk_size(chunk_size)
         dev, instances, vsys_dict = self._gather_bulk_info('delete_similar')
         if not instances:
             return
@@ -1831,22 +1845,40 @@ class PanObject(object):
         # Do all necessary unimports, per vsys, per xpath.
         self._perform_vsys_dict_import_delete(dev, vsys_dict)
 
-        # Now perform the bulk delete.
-        xpath = self.xpath_nosuffix()
-        if self.SUFFIX == ENTRY:
-            entries = ' or '.join(
-                "@name='{0}'".format(x.uid) for x in instances)
-            xpath += '/entry[{0}]'.format(entries)
-        elif self.SUFFIX == MEMBER:
-            members = ' or '.join(
-                "text()='{0}'".format(x.uid) for x in instances)
-            xpath += '/member[{0}]'.format(members)
-        dev.xapi.delete(xpath, retry_on_peer=self.HA_SYNC)
+        # Now perform the bulk delete, one API call per chunk.
+        base_xpath = self.xpath_nosuffix()
+        for chunk in self._chunks(instances, chunk_size):
+            if self.SUFFIX == ENTRY:
+                entries = ' or '.join(
+                    "@name='{0}'".format(x.uid) for x in chunk)
+                xpath = base_xpath + '/entry[{0}]'.format(entries)
+            elif self.SUFFIX == MEMBER:
+                members = ' or '.join(
+                    "text()='{0}'".format(x.uid) for x in chunk)
+                xpath = base_xpath + '/member[{0}]'.format(members)
+            dev.xapi.delete(xpath, retry_on_peer=self.HA_SYNC)
 
         # Remove each object from self, just like delete().
         for x in instances:
             x.parent.remove(x)
 
+    @staticmethod
+    def _check_chunk_size(chunk_size):
+        """Raises ValueError if chunk_size is not None or a positive int."""
+        if chunk_size is None:
+            return
+        if (isinstance(chunk_size, bool) or
+                not isinstance(chunk_size, int) or chunk_size < 1):
+            raise ValueError('chunk_size must be a positive integer')
+
+    @staticmethod
+    def _chunks(instances, chunk_size=None):
+        """Splits instances into lists of at most chunk_size items."""
+        if chunk_size is None:
+            chunk_size = len(instances)
+        return [instances[i:i + chunk_size]
+                for i in range(0, len(instances), chunk_size)]
+
     def _perform_vsys_dict_import_set(self, dev, vsys_dict):
         """Iterates of a vsys_dict, doing imports for all instances."""
         for vsys, vsys_spec in vsys_dict.items():
@@ -2158,7 +2190,7 @@ class VersionedPanObject(PanObject):
     """
     _UNKNOWN_PANOS_VERSION = (sys.maxsize, 0, 0)
     _DEFAULT_NAME = None
-    _TEMPLATE_DEVICE_XPATH = "/config/devices/entry[@name='localhost.localdomain']"
+    _TEMPLATE_DEVICE_XPATH = DEVICE_XPATH
     _TEMPLATE_VSYS_XPATH = _TEMPLATE_DEVICE_XPATH + "/vsys/entry[@name='{vsys}']"
     _TEMPLATE_MGTCONFIG_XPATH = "/config/mgt-config"
 
@@ -3385,9 +3417,22 @@ class PanDevice(PanObject):
             err.PanConnectionTimeout, err.PanURLError,
             err.PanOutdatedSslError, err.PanSessionTimedOut)
 
+        # Set once the public PanXapi methods have been wrapped.
+        _methods_wrapped = False
+
+        # Shared by every instance that isn't given its own ssl_context.
+        _ssl_context = None
+
         def __init__(self, *args, **kwargs):
             self.pan_device = kwargs.pop('pan_device', None)
+            if kwargs.get('ssl_context') is None:
+                kwargs['ssl_context'] = self.unverified_ssl_context()
             pan.xapi.PanXapi.__init__(self, *args, **kwargs)
+            if not self._methods_wrapped:
+                self.wrap_methods()
+
+        @classmethod
+        def wrap_methods(cls):
             pred = lambda x: inspect.ismethod(x) or inspect.isfunction(x) # inspect.ismethod needed for Python2, inspect.isfunction needed for Python3
             for name, method in inspect.getmembers(
                     pan.xapi.PanXapi,
@@ -3405,10 +3450,29 @@ class PanDevice(PanObject):
                 # a try/except block, which allows us to check and
                 # analyze the exceptions and convert them to more
                 # useful exceptions than generic PanXapiErrors.
-                wrapper_method = PanDevice.XapiWrapper.make_method(name, method)
+                wrapper_method = cls.make_method(name, method)
 
                 # Create method matching each public method of the base class
-                setattr(PanDevice.XapiWrapper, name, wrapper_method)
+                setattr(cls, name, wrapper_method)
+            cls._methods_wrapped = True
+
+        @classmethod
+        def unverified_ssl_context(cls):
+            """Return the SSL context shared by all xapi connections.
+
+            This is the same unverified context pan-python would create for
+            each request.  Python versions without SSL contexts get None,
+            which leaves the choice to pan-python.
+
+            """
+            if cls._ssl_context is None:
+                try:
+                    import ssl
+                    context = ssl._create_unverified_context()
+                except (ImportError, AttributeError):
+                    return None
+                cls._ssl_context = context
+            return cls._ssl_context
 
         @classmethod
         def make_method(cls, super_method_name, super_method):
@@ -3683,7 +3747,7 @@ class PanDevice(PanObject):
         return "/config/mgt-config"
 
     def xpath_device(self):
-        return "/config/devices/entry[@name='localhost.localdomain']"
+        return DEVICE_XPATH
 
     def xpath_vsys(self):
         raise NotImplementedError
@@ -3763,7 +3827,14 @@ class PanDevice(PanObject):
         #    for e in ans.find('./result'):
         #        system_info['system'][e.tag] = e.text
 
-        system_info = self.show_system_info()
+        root = self.xapi.op(cmd="show system info", cmd_xml=True)
+        system = root.find('./result/system')
+        if system is None:
+            raise err.PanDeviceError("Problem parsing show system info",
+                                     pan_device=self)
+        system_info = {'system': {}}
+        for e in system:
+            system_info['system'][e.tag] = e.text
 
         # Save the system info to this object
         self._save_system_info(system_info)
@@ -3895,10 +3966,8 @@ class PanDevice(PanObject):
             bool: True if pending changes, False if not
 
         """
-        self.xapi.op(cmd="check pending-changes", cmd_xml=True, retry_on_peer=retry_on_peer)
-        pconf = PanConfig(self.xapi.element_result)
-        response = pconf.python()
-        return response['result']
+        response = self.xapi.op(cmd="check pending-changes", cmd_xml=True, retry_on_peer=retry_on_peer)
+        return yesno(response.findtext("./result"))
 
     def add_commit_lock(self, comment=None, scope="shared", exceptions=True, retry_on_peer=True):
         self._logger.debug("%s: Add commit lock requested for scope %s" % (self.id, scope))
@@ -19,10 +19,8 @@
 
 # import modules
 import itertools
-import re
 import logging
 import xml.etree.ElementTree as ET
-from decimal import Decimal
 
 from pandevice import getlogger
 from pandevice import device
@@ -139,6 +137,9 @@ class Firewall(PanDevice):
         self.state = FirewallState()
         """Panorama state variables refreshed by Panorama"""
 
+        # (vsys, xpath) of the last xpath_vsys() call
+        self._xpath_vsys_cache = None
+
     def __repr__(self):
         return "<%s %s %s at 0x%x>" % (type(self).__name__, repr(self.id), repr(self.vsys), id(self))
 
@@ -164,7 +165,12 @@ class Firewall(PanDevice):
             self.ha_peer._vsys = value
 
     def xpath_vsys(self):
-        return self._root_xpath_vsys(self.vsys)
+        # Only rebuild the xpath when the vsys has changed.  Keying the cache
+        # on the vsys itself also covers changes to the 'shared' flag.
+        vsys = self.vsys
+        if self._xpath_vsys_cache is None or self._xpath_vsys_cache[0] != vsys:
+            self._xpath_vsys_cache = (vsys, self._root_xpath_vsys(vsys))
+        return self._xpath_vsys_cache[1]
 
     def xpath_panorama(self):
         raise err.PanDeviceError("Attempt to modify Panorama configuration on non-Panorama device")
@@ -281,7 +287,10 @@ class Firewall(PanDevice):
             panorama.set_config_changed()
             panorama.xapi.delete(self.xpath())
         if self.parent is not None:
-            self.parent.remove_by_name(self.uid, type(self))
+            # Remove this exact instance: firewalls for different vsys of
+            # the same device share a serial, so removing by name could
+            # drop a sibling instead.
+            self.parent.remove(self)
 
     def create_vsys(self):
         """Create the vsys on the live device that this Firewall object represents"""
@@ -319,9 +328,13 @@ class Firewall(PanDevice):
             # This is a 'show devices' op command
             firewall_instances = super(Firewall, self).refreshall_from_xml(
                 xml, refresh_children=False, variables=op_vars)
+            # Several entries share a serial when vsys are expanded, keep the first
+            entries = {}
+            for entry in xml.findall("entry"):
+                entries.setdefault(entry.get("name"), entry)
             # Add system settings to firewall instances
             for fw in firewall_instances:
-                entry = xml.find("entry[@name='%s']" % fw.serial)
+                entry = entries.get(fw.serial)
                 system = fw.find_or_create(None, device.SystemSettings)
                 system.hostname = entry.findtext("hostname")
                 system.ip_address = entry.findtext("ip-address")
@@ -345,27 +358,56 @@ class Firewall(PanDevice):
         return firewall_instances
 
     def show_system_resources(self):
+        """Parse the top output returned by "show system resources"
+
+        Returns:
+            dict: load, cpu (percent busy), mem_total and mem_free
+
+        """
         self.xapi.op(cmd="show system resources", cmd_xml=True)
         result = self.xapi.xml_root()
-        if self._version_info >= (9, 0, 0):
-            regex = re.compile(r'load average: ([\d\.]+).*? ([\d\.]+) id,.*KiB Mem : (\d+) total,.*? (\d+) free', re.DOTALL)
-        else:
-            regex = re.compile(r"load average: ([\d.]+).* ([\d.]+)%id.*Mem:.*?([\d.]+)k total.*?([\d]+)k free", re.DOTALL)
-        match = regex.search(result)
-        if match:
-            """
-            return cpu, mem_free, load
-            """
+        load = cpu_idle = mem_total = mem_free = None
+        for line in result.splitlines():
+            if load is None and "load average:" in line:
+                load = line.split("load average:", 1)[1].split(",")[0].strip()
+                continue
+            label, sep, fields = line.partition(":")
+            if not sep or not label.split():
+                continue
+            label = label.split()[-1]
+            if cpu_idle is None and label.endswith("Cpu(s)"):
+                cpu_idle = self._top_field(fields, "id")
+            elif mem_total is None and label == "Mem":
+                mem_total = self._top_field(fields, "total")
+                mem_free = self._top_field(fields, "free")
+        try:
             return {
-                'load': Decimal(match.group(1)),
-                'cpu': 100 - Decimal(match.group(2)),
-                'mem_total': int(match.group(3)),
-                'mem_free': int(match.group(4)),
+                'load': float(load),
+                'cpu': 100.0 - float(cpu_idle),
+                'mem_total': int(mem_total.rstrip("k")),
+                'mem_free': int(mem_free.rstrip("k")),
             }
-        else:
+        except (AttributeError, TypeError, ValueError):
             raise err.PanDeviceError("Problem parsing show system resources",
                                      pan_device=self)
 
+    @staticmethod
+    def _top_field(fields, name):
+        """Return the value of a field of a top summary line
+
+        Handles both "98.2%id" (PAN-OS < 9.0) and "98.2 id" (PAN-OS >= 9.0).
+
+        """
+        suffix = "%" + name
+        for field in fields.split(","):
+            words = field.split()
+            if not words:
+                continue
+            if words[-1] == name and len(words) > 1:
+                return words[-2]
+            elif words[-1].endswith(suffix):
+                return words[-1][:-len(suffix)]
+
     def commit_device_and_network(self, sync=False, exception=False):
         return self._commit(sync=sync, exclude="device-and-network",
                             exception=exception)
@@ -35,6 +35,13 @@ import pandevice.errors as err
 logger = getlogger(__name__)
 
 
+def _interface_name(interface):
+    """Return the name of an interface given as a string or Interface object"""
+    if isstring(interface):
+        return interface
+    return str(interface)
+
+
 class HighAvailabilityInterface(PanObject):
     """Base class for high availability interface classes
 
@@ -95,10 +102,7 @@ class HighAvailabilityInterface(PanObject):
         pandevice = self.nearest_pandevice()
         if pandevice is None:
             return None
-        if isstring(self.port):
-            intname = self.port
-        else:
-            intname = str(self.port)
+        intname = _interface_name(self.port)
         intconfig_needed = False
         inttype = None
         if intname.startswith("ethernet"):
@@ -162,10 +166,7 @@ class HighAvailabilityInterface(PanObject):
         if pan_device is None:
             return None
         port = interface if interface is not None else self.port
-        if isstring(port):
-            intname = port
-        else:
-            intname = str(port)
+        intname = _interface_name(port)
         if intname.startswith("ethernet"):
             interface = pan_device.find(intname, network.EthernetInterface)
             if interface is None:
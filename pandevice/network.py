@@ -21,10 +21,9 @@
 import re
 import logging
 import xml.etree.ElementTree as ET
-import pandevice
 from pandevice.base import PanObject, Root, MEMBER, ENTRY
 from pandevice.base import VarPath as Var
-from pandevice import getlogger, string_or_list
+from pandevice import getlogger, string_or_list, convert_if_int, isstring
 from pandevice import device
 from pandevice.base import VersionedPanObject
 from pandevice.base import VersionedParamPath
@@ -403,34 +402,32 @@ class Interface(VsysOperations):
 
         Returns:
             dict: counter name as key, counter as value, None if interface is
-                not configured
+                not configured.  Numeric counters are ints, yes/no values are
+                bools, nested elements are dicts and empty elements are None.
 
         """
         from pan.config import PanConfig
 
         device = self.nearest_pandevice()
         cmd = 'show counter interface "{0}"'.format(self.name)
-        pconf = device.op(cmd)
-        pconf = PanConfig(pconf)
-        response = pconf.python()
-        logger.debug("response: " + str(response))
-        counters = response['response']['result']
-        if counters is not None:
-            entry = {}
-            # Check for entry in ifnet
-            if 'entry' in counters.get('ifnet', {}):
-                entry = counters['ifnet']['entry'][0]
-            elif 'ifnet' in counters.get('ifnet', {}):
-                if 'entry' in counters['ifnet'].get('ifnet', {}):
-                    entry = counters['ifnet']['ifnet']['entry'][0]
-
-            # Convert strings to integers, if they are integers
-            entry.update((k, pandevice.convert_if_int(v))
-                         for k, v in entry.items())
-
-            # If empty dictionary (no results) it usually means the interface is not
-            # configured, so return None
-            return entry if entry else None
+        response = device.op(cmd)
+
+        # Check for entry in ifnet
+        elm = response.find('./result/ifnet/entry')
+        if elm is None:
+            elm = response.find('./result/ifnet/ifnet/entry')
+        if elm is None:
+            return None
+
+        entry = PanConfig(elm).python()['entry'] or {}
+
+        # Convert strings to integers, if they are integers
+        entry.update((k, convert_if_int(v))
+                     for k, v in entry.items() if isstring(v))
+
+        # If empty dictionary (no results) it usually means the interface is not
+        # configured, so return None
+        return entry if entry else None
 
     def refresh_state(self):
         """Pull the state of the interface from the firewall
@@ -28,7 +28,7 @@ from pandevice import getlogger, yesno
 from pandevice import base, firewall, policies
 import pandevice.errors as err
 from pandevice.base import VarPath as Var
-from pandevice.base import PanObject, Root, MEMBER, ENTRY
+from pandevice.base import PanObject, Root, MEMBER, ENTRY, DEVICE_XPATH
 from pandevice.base import VersionedPanObject, VersionedParamPath
 
 import pan.commit
@@ -166,13 +166,13 @@ class Template(VersionedPanObject):
 
         self._params = tuple(params)
 
-    def create_similar(self):
+    def create_similar(self, chunk_size=None):
         raise NotImplementedError('This is not supported for templates')
 
     def apply_similar(self):
         raise NotImplementedError('This is not supported for templates')
 
-    def delete_similar(self):
+    def delete_similar(self, chunk_size=None):
         raise NotImplementedError('This is not supported for templates')
 
 
@@ -230,13 +230,13 @@ class TemplateStack(VersionedPanObject):
 
         self._params = tuple(params)
 
-    def create_similar(self):
+    def create_similar(self, chunk_size=None):
         raise NotImplementedError('This is not supported for template stacks')
 
     def apply_similar(self):
         raise NotImplementedError('This is not supported for template stacks')
 
-    def delete_similar(self):
+    def delete_similar(self, chunk_size=None):
         raise NotImplementedError('This is not supported for template stacks')
 
 
@@ -498,16 +498,18 @@ class Panorama(base.PanDevice):
 
         # Manipulate devices_xml so each vsys is a separate device
         if expand_vsys:
-            original_devices_xml = deepcopy(devices_xml)
-            devices_xml = ET.Element("devices")
-            for entry in original_devices_xml:
+            vsys_devices_xml = ET.Element("devices")
+            for entry in devices_xml:
                 serial = entry.findtext("serial")
                 for vsys_entry in entry.findall("vsys/entry"):
                     new_vsys_device = deepcopy(entry)
                     new_vsys_device.set("name", serial)
                     ET.SubElement(new_vsys_device, "vsys_id").text = vsys_entry.get("name")
                     ET.SubElement(new_vsys_device, "vsys_name").text = vsys_entry.findtext("display-name")
-                    devices_xml.append(new_vsys_device)
+                    vsys_devices_xml.append(new_vsys_device)
+                # Each vsys has its own copy now, so free the original
+                entry.clear()
+            devices_xml = vsys_devices_xml
 
         # Create firewall instances
         tmp_fw = self.FIREWALL_CLASS()
@@ -524,7 +526,7 @@ class Panorama(base.PanDevice):
 
         # Get the list of device groups from configuration XML
         api_action = self.xapi.show if running_config else self.xapi.get
-        devicegroup_configxml = api_action("/config/devices/entry[@name='localhost.localdomain']/device-group")
+        devicegroup_configxml = api_action(DEVICE_XPATH + "/device-group")
         devicegroup_configxml = devicegroup_configxml.find("result/device-group")
 
         # Get the list of device groups from operational commands
@@ -534,11 +536,16 @@ class Panorama(base.PanDevice):
         # Combine the config XML and operational command XML to get a complete picture
         # of the device groups
         if devicegroup_configxml is not None:
+            fw_entries_op = {}
+            if devicegroup_opxml is not None:
+                for fw_entry_op in devicegroup_opxml.findall("entry/devices/entry"):
+                    fw_entries_op.setdefault(fw_entry_op.get("name"), fw_entry_op)
             for dg_entry in devicegroup_configxml:
-                if dg_entry.find('devices') is None:
+                dg_devices = dg_entry.find('devices')
+                if dg_devices is None:
                     continue
-                for fw_entry in dg_entry.find('devices'):
-                    fw_entry_op = devicegroup_opxml.find("entry/devices/entry[@name='%s']" % fw_entry.get("name"))
+                for fw_entry in dg_devices:
+                    fw_entry_op = fw_entries_op.get(fw_entry.get("name"))
                     if fw_entry_op is not None:
                         pandevice.xml_combine(fw_entry, fw_entry_op)
 
@@ -547,34 +554,42 @@ class Panorama(base.PanDevice):
         devicegroup_instances = dg.refreshall_from_xml(
             devicegroup_configxml, refresh_children=False)
 
+        requested_serials = set(str(f) for f in devices)
+        requested_vsys = None
+        if devices:
+            try:
+                requested_vsys = set(f.vsys for f in devices)
+            except AttributeError:
+                # Passed in string serials, no vsys, so get all vsys
+                pass
+            else:
+                if "shared" in requested_vsys or None in requested_vsys:
+                    requested_vsys = None
+
+        # Index the firewall instances by serial and vsys.
+        fw_instances = {}
+        for fw in firewall_instances:
+            fw_instances.setdefault((fw.serial, fw.vsys), []).append(fw)
+
         for dg in devicegroup_instances:
-            dg_serials = [entry.get("name") for entry in devicegroup_configxml.findall("entry[@name='%s']/devices/entry" % dg.name)]
+            fw_entries = devicegroup_configxml.findall("entry[@name='%s']/devices/entry" % dg.name)
             # Find firewall with each serial
-            for dg_serial in dg_serials:
+            for fw_entry in fw_entries:
+                dg_serial = fw_entry.get("name")
                 # Skip devices not requested
-                if devices and dg_serial not in [str(f) for f in devices]:
+                if devices and dg_serial not in requested_serials:
                     continue
-                all_dg_vsys = [entry.get("name") for entry in devicegroup_configxml.findall(
-                    "entry[@name='%s']/devices/entry[@name='%s']/vsys/entry" % (dg.name, dg_serial))]
-                # Collect the firewall serial entry to get current status information
-                fw_entry = devicegroup_configxml.find("entry[@name='%s']/devices/entry[@name='%s']" % (dg.name, dg_serial))
+                all_dg_vsys = [entry.get("name") for entry in fw_entry.findall("vsys/entry")]
                 if not all_dg_vsys:
                     # This is a single-context firewall, assume vsys1
                     all_dg_vsys = ["vsys1"]
                 for dg_vsys in all_dg_vsys:
                     # Check if this is a requested vsys in devices argument
-                    if devices:
-                        try:
-                            requested_vsys = [f.vsys for f in devices]
-                        except AttributeError:
-                            # Passed in string serials, no vsys, so get all vsys
-                            pass
-                        else:
-                            if "shared" not in requested_vsys and None not in requested_vsys and dg_vsys not in requested_vsys:
-                                # A specific vsys was requested, and this isn't it, skip
-                                continue
-                    fw = next((x for x in firewall_instances if x.serial == dg_serial and x.vsys == dg_vsys), None)
-                    if fw is None:
+                    if requested_vsys is not None and dg_vsys not in requested_vsys:
+                        # A specific vsys was requested, and this isn't it, skip
+                        continue
+                    matches = fw_instances.get((dg_serial, dg_vsys))
+                    if not matches:
                         # It's possible for device-groups to reference a serial/vsys that doesn't exist
                         # In this case, create the FW instance
                         if not only_connected:
@@ -582,6 +597,7 @@ class Panorama(base.PanDevice):
                             dg.add(fw)
                     else:
                         # Move the firewall to the device-group
+                        fw = matches.pop(0)
                         dg.add(fw)
                         firewall_instances.remove(fw)
                         shared_policy_status = fw_entry.findtext("shared-policy-status")
@@ -228,7 +228,7 @@ class SoftwareUpdater(Updater):
         if version.minor == 1:
             next_version = PanOSVersion(str(version.major+1)+".0.0")
         # There is no PAN-OS 5.1 for firewalls, so next minor release from 5.0.x is 6.0.0.
-        elif version.major == 5 and version.minor == 0 and issubclass(type(self.pandevice), Firewall):
+        elif version.major == 5 and version.minor == 0 and isinstance(self.pandevice, Firewall):
             next_version = PanOSVersion("6.0.0")
         else:
             next_version = PanOSVersion(str(version.major)+".1.0")
@@ -279,7 +279,7 @@ class SoftwareUpdater(Updater):
         from pandevice.firewall import Firewall
         if (current_version.major == 5 and current_version.minor == 0
             and target_version == "6.0.0"
-            and issubclass(type(self.pandevice), Firewall)):
+            and isinstance(self.pandevice, Firewall)):
             return True
 
         return False
@@ -426,7 +426,7 @@ class UserId(object):
 
         """
         device_list = self.get_registered_ip()
-        requested_list = deepcopy(ip_tags_pairs)
+        requested_list = dict(ip_tags_pairs)
         self.batch_start()
         # Handle unregistrations
         for ip, tags in device_list.items():
@@ -1427,5 +1427,114 @@ class TestTree(unittest.TestCase):
         self.assertEqual(ret_val, expected)
 
 
+class TestSimilar(unittest.TestCase):
+    def setUp(self):
+        import pandevice.firewall as Firewall
+        import pandevice.objects as Objects
+
+        self.fw = Firewall.Firewall('127.0.0.1', 'admin', 'admin', 'secret')
+        self.fw._version_info = (9999, 0, 0)
+        self.fw._xapi_private = mock.Mock()
+        self.objs = [Objects.AddressObject('addr{0}'.format(x), '10.0.0.{0}'.format(x))
+                     for x in range(5)]
+        self.fw.extend(self.objs)
+
+    def test_create_similar_sends_all_objects_in_one_call(self):
+        self.objs[0].create_similar()
+
+        self.assertEqual(1, self.fw.xapi.set.call_count)
+        elm = ET.fromstring(self.fw.xapi.set.call_args[0][1])
+        self.assertEqual(5, len(elm))
+
+    def test_create_similar_with_chunk_size_splits_calls(self):
+        self.objs[0].create_similar(chunk_size=2)
+
+        self.assertEqual(3, self.fw.xapi.set.call_count)
+        sizes = [len(ET.fromstring(x[0][1]))
+                 for x in self.fw.xapi.set.call_args_list]
+        self.assertEqual([2, 2, 1], sizes)
+
+    def test_delete_similar_with_chunk_size_splits_calls(self):
+        self.objs[0].delete_similar(chunk_size=3)
+
+        self.assertEqual(2, self.fw.xapi.delete.call_count)
+        xpaths = [x[0][0] for x in self.fw.xapi.delete.call_args_list]
+        self.assertTrue(xpaths[0].endswith(
+            "/address/entry[@name='addr0' or @name='addr1' or @name='addr2']"))
+        self.assertTrue(xpaths[1].endswith(
+            "/address/entry[@name='addr3' or @name='addr4']"))
+        self.assertEqual([], self.fw.children)
+
+    def test_invalid_chunk_size_raises_before_any_api_call(self):
+        import pandevice.network as Network
+
+        eth = Network.EthernetInterface('ethernet1/1', mode='layer3')
+        self.fw.add(eth)
+        for chunk_size in (0, -1, 1.5, '2', True):
+            self.assertRaises(
+                ValueError, eth.delete_similar, chunk_size=chunk_size)
+            self.assertRaises(
+                ValueError, self.objs[0].create_similar, chunk_size=chunk_size)
+
+        self.assertFalse(self.fw.xapi.delete.called)
+        self.assertFalse(self.fw.xapi.set.called)
+        self.assertEqual(6, len(self.fw.children))
+
+
+class TestPendingChanges(unittest.TestCase):
+    def _pending_changes(self, result):
+        dev = Base.PanDevice('127.0.0.1', 'admin', 'admin', 'secret')
+        dev._xapi_private = mock.Mock(**{'op.return_value': ET.fromstring(
+            '<response status="success"><result>{0}</result></response>'.format(result))})
+
+        ret_val = dev.pending_changes()
+
+        dev.xapi.op.assert_called_once_with(
+            cmd='check pending-changes', cmd_xml=True, retry_on_peer=True)
+        return ret_val
+
+    def test_pending_changes_returns_true(self):
+        self.assertTrue(self._pending_changes('yes'))
+
+    def test_no_pending_changes_returns_false(self):
+        self.assertFalse(self._pending_changes('no'))
+
+
+
+class TestXapiWrapper(unittest.TestCase):
+    def _xapi(self, **kwargs):
+        return Base.PanDevice.XapiWrapper(
+            pan_device=mock.Mock(), hostname='127.0.0.1', api_key='secret',
+            **kwargs)
+
+    def test_ssl_context_is_shared(self):
+        xapi1 = self._xapi()
+        xapi2 = self._xapi()
+
+        self.assertIs(xapi1.ssl_context, xapi2.ssl_context)
+        self.assertIs(
+            Base.PanDevice.XapiWrapper.unverified_ssl_context(),
+            xapi1.ssl_context)
+
+    def test_explicit_ssl_context_is_kept(self):
+        context = mock.Mock()
+
+        xapi = self._xapi(ssl_context=context)
+
+        self.assertIs(context, xapi.ssl_context)
+
+    def test_methods_are_wrapped_by_first_instance(self):
+        cls = Base.PanDevice.XapiWrapper
+        with mock.patch.object(cls, '_methods_wrapped', False):
+            with mock.patch.object(
+                    cls, 'wrap_methods', wraps=cls.wrap_methods) as wrap:
+                self._xapi()
+                self._xapi()
+
+                self.assertEqual(1, wrap.call_count)
+                self.assertTrue(cls._methods_wrapped)
+        self.assertIsNot(pan.xapi.PanXapi.op, cls.op)
+
+
 if __name__=='__main__':
     unittest.main()
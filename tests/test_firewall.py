@@ -12,9 +12,16 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 import unittest
+import xml.etree.ElementTree as ET
 
 import pandevice
+import pandevice.device
+import pandevice.errors
 import pandevice.firewall
 
 
@@ -50,5 +57,131 @@ class TestFirewall(unittest.TestCase):
 
         self.assertEqual(expected, ret_val)
 
+    def test_xpath_vsys_follows_vsys_changes(self):
+        fw = pandevice.firewall.Firewall(vsys='vsys2')
+
+        self.assertEqual(
+            "/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys2']",
+            fw.xpath_vsys())
+        fw.vsys = 'vsys3'
+        self.assertEqual(
+            "/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys3']",
+            fw.xpath_vsys())
+        fw.vsys = 'shared'
+        self.assertEqual('/config/shared', fw.xpath_vsys())
+
+    def test_refreshall_from_xml_show_devices_sets_system_settings(self):
+        xml = ET.fromstring(
+            '<devices>'
+            '<entry name="serial1"><serial>serial1</serial>'
+            '<hostname>fw1</hostname><ip-address>10.0.0.1</ip-address>'
+            '<connected>yes</connected></entry>'
+            '<entry name="serial2"><serial>serial2</serial>'
+            '<hostname>fw2</hostname><ip-address>10.0.0.2</ip-address>'
+            '<connected>no</connected></entry>'
+            '</devices>')
+
+        fw = pandevice.firewall.Firewall()
+        ret_val = fw.refreshall_from_xml(xml)
+
+        self.assertEqual(['serial1', 'serial2'], [x.serial for x in ret_val])
+        for x, hostname, connected in zip(ret_val, ('fw1', 'fw2'), (True, False)):
+            system = x.findall(pandevice.device.SystemSettings)[0]
+            self.assertEqual(hostname, system.hostname)
+            self.assertEqual(connected, x.state.connected)
+
+    def test_delete_multi_vsys_removes_this_vsys_instance(self):
+        import pandevice.panorama
+
+        pano = pandevice.panorama.Panorama('127.0.0.1', 'admin', 'admin', 'secret')
+        pano._version_info = (8, 0, 0)
+        pano._xapi_private = mock.Mock(**{'get.return_value': ET.fromstring(
+            '<response><result><devices><entry name="serial1"><vsys>'
+            '<entry name="vsys1"/><entry name="vsys2"/>'
+            '</vsys></entry></devices></result></response>')})
+        dg = pandevice.panorama.DeviceGroup('dg1')
+        pano.add(dg)
+        fw1 = pandevice.firewall.Firewall(serial='serial1', vsys='vsys1', multi_vsys=True)
+        fw2 = pandevice.firewall.Firewall(serial='serial1', vsys='vsys2', multi_vsys=True)
+        dg.extend([fw1, fw2])
+
+        fw2.delete()
+
+        self.assertEqual([fw1, ], dg.children)
+        self.assertEqual(1, pano.xapi.delete.call_count)
+        self.assertTrue(pano.xapi.delete.call_args[0][0].endswith(
+            "/vsys/entry[@name='vsys2']"))
+
+    def test_refresh_system_info(self):
+        fw = pandevice.firewall.Firewall('127.0.0.1', 'admin', 'admin', 'secret')
+        fw._xapi_private = mock.Mock(**{'op.return_value': ET.fromstring(
+            '<response status="success"><result><system>'
+            '<hostname>fw1</hostname><model>PA-VM</model>'
+            '<serial>serial1</serial><sw-version>8.1.3</sw-version>'
+            '<multi-vsys>on</multi-vsys>'
+            '</system></result></response>')})
+
+        ret_val = fw.refresh_system_info()
+
+        fw.xapi.op.assert_called_once_with(cmd='show system info', cmd_xml=True)
+        self.assertEqual(('8.1.3', 'PA-VM', 'serial1'), tuple(ret_val))
+        self.assertEqual((8, 1, 3), fw._version_info)
+        self.assertTrue(fw.multi_vsys)
+
+    def test_refresh_system_info_without_system_raises(self):
+        fw = pandevice.firewall.Firewall('127.0.0.1', 'admin', 'admin', 'secret')
+        fw._xapi_private = mock.Mock(**{'op.return_value': ET.fromstring(
+            '<response status="success"><result/></response>')})
+
+        self.assertRaises(
+            pandevice.errors.PanDeviceError, fw.refresh_system_info)
+
+
+class TestShowSystemResources(unittest.TestCase):
+    PRE_9_0 = '\n'.join((
+        '<response status="success"><result><![CDATA['
+        'top - 14:59:21 up 2 days, 22:49,  0 users,  load average: 0.25, 0.31, 0.35',
+        'Tasks: 134 total,   2 running, 132 sleeping,   0 stopped,   0 zombie',
+        'Cpu(s):  1.1%us,  0.5%sy,  0.0%ni, 98.2%id,  0.1%wa,  0.0%hi,  0.1%si,  0.0%st',
+        'Mem:   4053000k total,  3798960k used,   254040k free,    42636k buffers',
+        'Swap:  2007832k total,   520360k used,  1487472k free,   912540k cached',
+        ']]></result></response>',
+    ))
+    POST_9_0 = '\n'.join((
+        '<response status="success"><result><![CDATA['
+        'top - 10:15:37 up 1 day, 12:33,  0 users,  load average: 0.52, 0.45, 0.41',
+        'Tasks: 132 total,   1 running, 131 sleeping,   0 stopped,   0 zombie',
+        '%Cpu(s):  2.3 us,  1.3 sy,  0.2 ni, 96.0 id,  0.0 wa,  0.0 hi,  0.2 si,  0.0 st',
+        'KiB Mem :  4119516 total,   181072 free,  1964956 used,  1973488 buff/cache',
+        'KiB Swap:        0 total,        0 free,        0 used.  1775100 avail Mem',
+        ']]></result></response>',
+    ))
+
+    def _show(self, output):
+        fw = pandevice.firewall.Firewall('127.0.0.1', 'admin', 'admin', 'secret')
+        fw._xapi_private = mock.Mock(**{'xml_root.return_value': output})
+        return fw.show_system_resources()
+
+    def test_pre_9_0_output(self):
+        ret_val = self._show(self.PRE_9_0)
+
+        self.assertAlmostEqual(0.25, ret_val['load'])
+        self.assertAlmostEqual(1.8, ret_val['cpu'])
+        self.assertEqual(4053000, ret_val['mem_total'])
+        self.assertEqual(254040, ret_val['mem_free'])
+
+    def test_post_9_0_output(self):
+        ret_val = self._show(self.POST_9_0)
+
+        self.assertAlmostEqual(0.52, ret_val['load'])
+        self.assertAlmostEqual(4.0, ret_val['cpu'])
+        self.assertEqual(4119516, ret_val['mem_total'])
+        self.assertEqual(181072, ret_val['mem_free'])
+
+    def test_unparseable_output_raises_error(self):
+        self.assertRaises(
+            pandevice.errors.PanDeviceError, self._show,
+            '<response status="success"><result>nope</result></response>')
+
 if __name__=='__main__':
     unittest.main()
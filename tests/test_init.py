@@ -12,6 +12,10 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 import unittest
 
 import pandevice
@@ -140,5 +144,63 @@ class TestPanOSVersion(unittest.TestCase):
     def test_hotfix_version_is_greater_than_previous_same_release_version(self):
         self.assertTrue(self.h3 > self.m2)
 
+
+class TestRunConcurrently(unittest.TestCase):
+    def test_results_are_returned_in_device_order(self):
+        devices = [mock.Mock(**{'op.return_value': x}) for x in range(5)]
+
+        ret_val = pandevice.run_concurrently(
+            devices, 'op', args=('show system info', ), kwargs={'xml': True},
+            threads=2)
+
+        self.assertEqual(list(range(5)), ret_val)
+        for dev in devices:
+            dev.op.assert_called_once_with('show system info', xml=True)
+
+    def test_no_devices_returns_empty_list(self):
+        self.assertEqual([], pandevice.run_concurrently([], 'op'))
+
+    def test_exception_is_reraised(self):
+        devices = [
+            mock.Mock(**{'op.return_value': 1}),
+            mock.Mock(**{'op.side_effect': ValueError}),
+        ]
+
+        self.assertRaises(
+            ValueError, pandevice.run_concurrently, devices, 'op')
+
+    def test_duplicate_device_raises(self):
+        dev = mock.Mock()
+
+        self.assertRaises(
+            ValueError, pandevice.run_concurrently, [dev, dev], 'op')
+        self.assertFalse(dev.op.called)
+
+    def test_ha_pair_raises(self):
+        fw1 = mock.Mock()
+        fw2 = mock.Mock(ha_peer=fw1)
+        fw1.ha_peer = fw2
+
+        self.assertRaises(
+            ValueError, pandevice.run_concurrently, [fw1, fw2], 'op')
+        self.assertFalse(fw1.op.called)
+        self.assertFalse(fw2.op.called)
+
+    def test_firewalls_under_one_panorama_raise(self):
+        from pandevice.firewall import Firewall
+        from pandevice.panorama import Panorama
+
+        pano = Panorama('127.0.0.1', 'admin', 'admin', 'secret')
+        pano._xapi_private = mock.Mock()
+        fw1 = Firewall(serial='serial1')
+        fw2 = Firewall(serial='serial2')
+        pano.add(fw1)
+        pano.add(fw2)
+
+        self.assertRaises(
+            ValueError, pandevice.run_concurrently, [fw1, fw2], 'delete')
+        self.assertFalse(pano.xapi.delete.called)
+        self.assertEqual([fw1, fw2], pano.children)
+
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+# Copyright (c) 2014, Palo Alto Networks
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+import unittest
+import xml.etree.ElementTree as ET
+
+import pandevice.network
+
+
+class TestGetCounters(unittest.TestCase):
+    def _counters(self, response):
+        eth = pandevice.network.EthernetInterface('ethernet1/1')
+        dev = mock.Mock(**{'op.return_value': ET.fromstring(response)})
+        eth.nearest_pandevice = mock.Mock(return_value=dev)
+
+        ret_val = eth.get_counters()
+
+        dev.op.assert_called_once_with('show counter interface "ethernet1/1"')
+        return ret_val
+
+    def test_ifnet_entry(self):
+        ret_val = self._counters(
+            '<response status="success"><result><ifnet>'
+            '<entry><name>ethernet1/1</name><ibytes>100</ibytes>'
+            '<obytes>200</obytes></entry>'
+            '<entry><name>ethernet1/2</name></entry>'
+            '</ifnet></result></response>')
+
+        self.assertEqual(
+            {'name': 'ethernet1/1', 'ibytes': 100, 'obytes': 200}, ret_val)
+
+    def test_nested_ifnet_entry(self):
+        ret_val = self._counters(
+            '<response status="success"><result><ifnet><ifnet>'
+            '<entry><name>ethernet1/1</name><ipackets>7</ipackets></entry>'
+            '</ifnet></ifnet></result></response>')
+
+        self.assertEqual({'name': 'ethernet1/1', 'ipackets': 7}, ret_val)
+
+    def test_yes_no_and_nested_values(self):
+        ret_val = self._counters(
+            '<response status="success"><result><ifnet>'
+            '<entry><name>ethernet1/1</name><up>yes</up>'
+            '<lag><active>no</active><id>3</id></lag></entry>'
+            '</ifnet></result></response>')
+
+        self.assertEqual(
+            {'name': 'ethernet1/1', 'up': True,
+             'lag': {'active': False, 'id': '3'}}, ret_val)
+
+    def test_empty_counter_is_none(self):
+        ret_val = self._counters(
+            '<response status="success"><result><ifnet>'
+            '<entry><name>ethernet1/1</name><ibytes>100</ibytes><zone/></entry>'
+            '</ifnet></result></response>')
+
+        self.assertEqual(
+            {'name': 'ethernet1/1', 'ibytes': 100, 'zone': None}, ret_val)
+
+    def test_unconfigured_interface_returns_none(self):
+        ret_val = self._counters(
+            '<response status="success"><result><hw/></result></response>')
+
+        self.assertIsNone(ret_val)
+
+
+if __name__=='__main__':
+    unittest.main()
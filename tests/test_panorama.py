@@ -0,0 +1,99 @@
+# Copyright (c) 2014, Palo Alto Networks
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+import unittest
+import xml.etree.ElementTree as ET
+
+import pandevice.panorama
+
+
+DEVICES = (
+    '<response><result><devices>'
+    '<entry name="s1"><serial>s1</serial><connected>yes</connected>'
+    '<multi-vsys>yes</multi-vsys><vsys>'
+    '<entry name="vsys1"><display-name>v1</display-name></entry>'
+    '<entry name="vsys2"><display-name>v2</display-name></entry>'
+    '</vsys></entry>'
+    '<entry name="s2"><serial>s2</serial><connected>no</connected>'
+    '<multi-vsys>no</multi-vsys><vsys>'
+    '<entry name="vsys1"><display-name>vsys1</display-name></entry>'
+    '</vsys></entry>'
+    '</devices></result></response>'
+)
+
+DEVICEGROUP_CONFIG = (
+    '<response><result><device-group>'
+    '<entry name="dg1"><devices>'
+    '<entry name="s1"><vsys><entry name="vsys2"/></vsys></entry>'
+    '<entry name="s2"/>'
+    '</devices></entry>'
+    '</device-group></result></response>'
+)
+
+DEVICEGROUP_OP = (
+    '<response><result><devicegroups>'
+    '<entry name="dg1"><devices>'
+    '<entry name="s1"><vsys><entry name="vsys2">'
+    '<shared-policy-status>In Sync</shared-policy-status>'
+    '</entry></vsys></entry>'
+    '<entry name="s2">'
+    '<shared-policy-status>Out of Sync</shared-policy-status>'
+    '</entry>'
+    '</devices></entry>'
+    '</devicegroups></result></response>'
+)
+
+
+class TestRefreshDevices(unittest.TestCase):
+    def setUp(self):
+        self.pano = pandevice.panorama.Panorama('127.0.0.1', 'admin', 'admin', 'secret')
+        self.pano._version_info = (8, 0, 0)
+
+        def op(cmd, *args, **kwargs):
+            if cmd == 'show devicegroups':
+                return ET.fromstring(DEVICEGROUP_OP)
+            return ET.fromstring(DEVICES)
+
+        self.pano.op = mock.Mock(side_effect=op)
+        self.pano._xapi_private = mock.Mock(**{
+            'get.return_value': ET.fromstring(DEVICEGROUP_CONFIG)})
+
+    def test_firewalls_are_moved_into_device_groups(self):
+        ret_val = self.pano.refresh_devices()
+
+        fw_s1v1, dg1 = ret_val
+        self.assertEqual(('s1', 'vsys1'), (fw_s1v1.serial, fw_s1v1.vsys))
+        self.assertEqual('dg1', dg1.name)
+        self.assertEqual(
+            [('s1', 'vsys2', True), ('s2', 'vsys1', False)],
+            [(x.serial, x.vsys, x.state.shared_policy_synced)
+             for x in dg1.children])
+
+    def test_only_requested_vsys_is_moved(self):
+        fw = pandevice.firewall.Firewall(serial='s1', vsys='vsys2')
+
+        ret_val = self.pano.refresh_devices(devices=[fw, ])
+
+        self.assertEqual(1, len(ret_val))
+        self.assertEqual(
+            [('s1', 'vsys2')],
+            [(x.serial, x.vsys) for x in ret_val[0].children])
+
+
+if __name__=='__main__':
+    unittest.main()